@@ -0,0 +1,85 @@
+#
+# Copyright (C) 2020 Arm Mbed. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+"""Benchmark `Boards` set operations, as used when syncing the board database.
+
+Compares the hash based `Boards` against a collection using the previous linear membership test.
+The linear implementation is quadratic, so it is measured on a smaller database by default.
+"""
+import argparse
+import timeit
+from collections.abc import Set
+from typing import Any, Iterable, Iterator, List
+
+from mbed_targets.board import Board
+from mbed_targets.boards import Boards
+
+
+class LinearScanBoards(Set):
+    """Boards collection using the previous linear membership test, for comparison."""
+
+    def __init__(self, boards_data: Iterable[Board]) -> None:
+        """Initialise with a list of boards."""
+        self._boards_data = tuple(boards_data)
+
+    def __iter__(self) -> Iterator[Board]:
+        """Yield a Board on each iteration."""
+        return iter(self._boards_data)
+
+    def __len__(self) -> int:
+        """Return the number of boards."""
+        return len(self._boards_data)
+
+    def __contains__(self, board: object) -> Any:
+        """Check if a board is in the collection by comparing it with every board."""
+        return any(x == board for x in self)
+
+
+def make_boards(count: int, offset: int = 0) -> List[Board]:
+    """Make `count` distinct boards, numbered from `offset`."""
+    return [
+        Board(
+            board_type=f"BOARD_{i}",
+            board_name=f"Board {i}",
+            product_code=f"{i:04x}",
+            target_type="platform",
+            slug=f"board-{i}",
+            build_variant=(),
+            mbed_os_support=("Mbed OS 6",),
+            mbed_enabled=("Baseline",),
+        )
+        for i in range(offset, offset + count)
+    ]
+
+
+def time_operations(collection_type: type, count: int, repeat: int) -> dict:
+    """Time the set operations for two collections of `count` boards which overlap by half."""
+    left = collection_type(make_boards(count))
+    right = collection_type(make_boards(count, offset=count // 2))
+    operations = {
+        "a - b": lambda: left - right,
+        "a & b": lambda: left & right,
+        "a | b": lambda: left | right,
+        "a == b": lambda: left == right,
+    }
+    return {name: min(timeit.repeat(operation, number=1, repeat=repeat)) for name, operation in operations.items()}
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=10_000, help="number of boards in each collection")
+    parser.add_argument("--linear-boards", type=int, default=1_000, help="number of boards for the linear baseline")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions, the best is reported")
+    args = parser.parse_args()
+
+    hashed = time_operations(Boards, args.boards, args.repeat)
+    linear = time_operations(LinearScanBoards, args.linear_boards, args.repeat)
+    print(f"Hashed Boards with {args.boards} boards, linear baseline with {args.linear_boards} boards.")
+    for name in hashed:
+        print(f"{name:<8} hashed: {hashed[name] * 1000:10.2f}ms    linear: {linear[name] * 1000:10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@
 This utility performs the following actions:
 * Downloads the latest online target database
 * Saves the database to a local file in the mbed-targets repository
+* Compiles the saved database into its binary form for fast lookups
 * Creates a new branch and commits the new target database
 * Pushes the branch to the mbed-targets remote and raises a github PR as Monty Bot.
 """
@@ -25,7 +26,8 @@ from mbed_tools_ci_scripts.utils.configuration import configuration, Configurati
 from mbed_tools_lib.exceptions import ToolsError
 from mbed_tools_lib.logging import log_exception, set_log_level
 
-from mbed_targets._internal.board_database import SNAPSHOT_FILENAME
+from mbed_targets._internal.board_database import COMPILED_SNAPSHOT_FILENAME, SNAPSHOT_FILENAME
+from mbed_targets._internal.compiled_board_database import compile_snapshot
 from mbed_targets.boards import Boards
 
 logger = logging.getLogger()
@@ -33,6 +35,7 @@ logger = logging.getLogger()
 BOARD_DATABASE_PATH = Path(
     configuration.get_value(ConfigurationVariable.PROJECT_ROOT), "mbed_targets", "_internal", "data", SNAPSHOT_FILENAME,
 )
+COMPILED_BOARD_DATABASE_PATH = BOARD_DATABASE_PATH.with_name(COMPILED_SNAPSHOT_FILENAME)
 
 
 class PullRequestInfo(NamedTuple):
@@ -155,7 +158,10 @@ def main(args: argparse.Namespace) -> int:
             news_file_path = create_news_file("Offline board database updated.", NewsType.feature)
 
         save_board_database(online_boards.json_dump(), BOARD_DATABASE_PATH)
-        git_commit_and_push([BOARD_DATABASE_PATH, news_file_path], pr_info.head_branch, pr_info.subject)
+        compile_snapshot(BOARD_DATABASE_PATH, COMPILED_BOARD_DATABASE_PATH)
+        git_commit_and_push(
+            [BOARD_DATABASE_PATH, COMPILED_BOARD_DATABASE_PATH, news_file_path], pr_info.head_branch, pr_info.subject
+        )
         raise_github_pr(pr_info)
         return 0
     except ToolsError as tools_error:
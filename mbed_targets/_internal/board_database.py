@@ -9,17 +9,23 @@ from http import HTTPStatus
 import json
 from json.decoder import JSONDecodeError
 import logging
-from typing import List, Optional, Dict, Any
+import threading
+from typing import List, Optional, Dict, Any, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from mbed_targets._internal.compiled_board_database import CompiledSnapshot
 from mbed_targets._internal.exceptions import ResponseJSONError, BoardAPIError
+from mbed_targets._internal.response_cache import CachedResponse, ResponseCache
 
 from mbed_targets.env import env
 
 
 INTERNAL_PACKAGE_DIR = pathlib.Path(__file__).parent
 SNAPSHOT_FILENAME = "board_database_snapshot.json"
+COMPILED_SNAPSHOT_FILENAME = "board_database_snapshot.bin"
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +35,11 @@ def get_board_database_path() -> pathlib.Path:
     return pathlib.Path(INTERNAL_PACKAGE_DIR, "data", SNAPSHOT_FILENAME)
 
 
+def get_compiled_board_database_path() -> pathlib.Path:
+    """Return the path to the compiled offline board database."""
+    return pathlib.Path(INTERNAL_PACKAGE_DIR, "data", COMPILED_SNAPSHOT_FILENAME)
+
+
 _BOARD_API = "https://os.mbed.com/api/v4/targets"
 
 
@@ -48,9 +59,42 @@ def get_offline_board_data() -> Any:
         raise ResponseJSONError(f"Invalid JSON received from '{boards_snapshot_path}'.") from json_err
 
 
+def get_compiled_offline_snapshot() -> Optional[CompiledSnapshot]:
+    """Returns the compiled offline snapshot, if it is present and up to date with the JSON snapshot.
+
+    The compiled snapshot is opened once and reused until either snapshot file changes on disk.
+    """
+    global _compiled_snapshot_cache
+    compiled_path = get_compiled_board_database_path()
+    snapshot_path = get_board_database_path()
+    key = (_file_key(compiled_path), _file_key(snapshot_path))
+    with _compiled_snapshot_lock:
+        if _compiled_snapshot_cache is None or _compiled_snapshot_cache[0] != key:
+            compiled_snapshot = CompiledSnapshot.open(compiled_path, snapshot_path)
+            if compiled_snapshot is None:
+                logger.debug(f"No up to date compiled snapshot found at '{compiled_path}', using the JSON snapshot.")
+            _compiled_snapshot_cache = (key, compiled_snapshot)
+        return _compiled_snapshot_cache[1]
+
+
+_FileKey = Optional[Tuple[int, int]]
+_compiled_snapshot_lock = threading.Lock()
+_compiled_snapshot_cache: Optional[Tuple[Tuple[_FileKey, _FileKey], Optional[CompiledSnapshot]]] = None
+
+
+def _file_key(path: pathlib.Path) -> _FileKey:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 def get_online_board_data() -> List[dict]:
     """Retrieves board data from the online API.
 
+    The response is cached on disk, see `mbed_targets.env.Env.MBED_API_CACHE_TTL`.
+
     Returns:
         The board database as retrieved from the boards API
 
@@ -58,24 +102,48 @@ def get_online_board_data() -> List[dict]:
         ResponseJSONError: error decoding the response JSON.
         BoardAPIError: error retrieving data from the board API.
     """
-    board_data: List[dict] = [{}]
-    response = _get_request()
+    response_cache, cache_key = _get_response_cache()
+    cached_response = _get_cached_response(response_cache, cache_key)
+    if cached_response is not None and cached_response.age < env.MBED_API_CACHE_TTL:
+        logger.debug("Using the cached response from the online database.")
+        return _decode_board_data(cached_response.body.decode("utf-8"))
+
+    response = _get_request(cached_response.conditional_headers() if cached_response else None)
+    if response.status_code == HTTPStatus.NOT_MODIFIED and cached_response is not None:
+        logger.debug("The online database has not changed since it was cached.")
+        response_cache.refresh(cache_key)
+        return _decode_board_data(cached_response.body.decode("utf-8"))
+
     if response.status_code != HTTPStatus.OK:
         warning_msg = _response_error_code_to_str(response)
         logger.warning(warning_msg)
         logger.debug(f"Response received from API:\n{response.text}")
         raise BoardAPIError(warning_msg)
 
+    board_data = _decode_board_data(response.text)
+    if env.MBED_API_CACHE_TTL >= 0:
+        response_cache.put(
+            cache_key, response.content, response.headers.get("ETag"), response.headers.get("Last-Modified")
+        )
+    return board_data
+
+
+def _decode_board_data(response_text: str) -> List[dict]:
+    """Decodes the board data from the text of a response from the board API.
+
+    Raises:
+        ResponseJSONError: error decoding the response JSON.
+    """
     try:
-        json_data = response.json()
+        json_data = json.loads(response_text)
     except JSONDecodeError as json_err:
         warning_msg = f"Invalid JSON received from '{_BOARD_API}'."
         logger.warning(warning_msg)
-        logger.debug(f"Response received from API:\n{response.text}")
+        logger.debug(f"Response received from API:\n{response_text}")
         raise ResponseJSONError(warning_msg) from json_err
 
     try:
-        board_data = json_data["data"]
+        board_data: List[dict] = json_data["data"]
     except KeyError as key_err:
         warning_msg = f"JSON received from '{_BOARD_API}' is missing the 'data' field."
         logger.warning(warning_msg)
@@ -86,6 +154,26 @@ def get_online_board_data() -> List[dict]:
     return board_data
 
 
+def _get_response_cache() -> Tuple[ResponseCache, str]:
+    """Returns the cache for responses from the board API and the key of the board API response.
+
+    Responses depend on the authentication token, as private boards are only visible to some users,
+    so the token is part of the key.
+    """
+    response_cache = ResponseCache(pathlib.Path(env.MBED_TARGETS_CACHE_DIR, "board_api"))
+    return response_cache, f"{_BOARD_API}\n{env.MBED_API_AUTH_TOKEN}"
+
+
+def _get_cached_response(response_cache: ResponseCache, cache_key: str) -> Optional[CachedResponse]:
+    """Returns the cached board API response, if the cache is enabled and holds one.
+
+    Only responses which were successfully decoded are stored, so the cached response is known to be valid.
+    """
+    if env.MBED_API_CACHE_TTL < 0:
+        return None
+    return response_cache.get(cache_key)
+
+
 def _response_error_code_to_str(response: requests.Response) -> str:
     if response.status_code == HTTPStatus.UNAUTHORIZED:
         return (
@@ -96,15 +184,59 @@ def _response_error_code_to_str(response: requests.Response) -> str:
         return f"An HTTP {response.status_code} was received from '{_BOARD_API}'."
 
 
-def _get_request() -> requests.Response:
-    """Make a GET request to the API, ensuring the correct headers are set."""
-    header: Optional[Dict[str, str]] = None
+def _get_request(extra_headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """Make a GET request to the API, ensuring the correct headers are set.
+
+    Args:
+        extra_headers: headers to send in addition to the authorization header, if any.
+    """
+    header: Optional[Dict[str, str]] = dict(extra_headers) if extra_headers else None
     mbed_api_auth_token = env.MBED_API_AUTH_TOKEN
     if mbed_api_auth_token:
-        header = {"Authorization": f"Bearer {mbed_api_auth_token}"}
+        header = {**(header or {}), "Authorization": f"Bearer {mbed_api_auth_token}"}
 
     try:
-        return requests.get(_BOARD_API, headers=header)
+        return _get_session().get(
+            _BOARD_API, headers=header, timeout=(env.MBED_API_CONNECT_TIMEOUT, env.MBED_API_READ_TIMEOUT)
+        )
     except requests.exceptions.ConnectionError as connection_error:
         logger.warning("There was an error connecting to the online database. Please check your internet connection.")
         raise BoardAPIError("Failed to connect to the online database.") from connection_error
+    except requests.exceptions.Timeout as timeout_error:
+        logger.warning("The online database took too long to respond. Please check your internet connection.")
+        raise BoardAPIError("Timed out waiting for the online database.") from timeout_error
+
+
+_RETRY_STATUSES = (HTTPStatus.TOO_MANY_REQUESTS, 500, 502, 503, 504)
+_session_lock = threading.Lock()
+_session: Optional[Tuple[Tuple[int, float], requests.Session]] = None
+
+
+def _get_session() -> requests.Session:
+    """Returns the session used for requests to the API, creating it on first use.
+
+    Sharing a session keeps connections to the API alive between requests. The session is recreated
+    if the retry configuration changes.
+    """
+    global _session
+    retry_config = (max(env.MBED_API_MAX_RETRIES, 0), env.MBED_API_RETRY_BACKOFF)
+    with _session_lock:
+        if _session is None or _session[0] != retry_config:
+            if _session is not None:
+                _session[1].close()
+            _session = (retry_config, _create_session(*retry_config))
+        return _session[1]
+
+
+def _create_session(max_retries: int, backoff_factor: float) -> requests.Session:
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=_RETRY_STATUSES,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
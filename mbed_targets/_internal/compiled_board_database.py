@@ -0,0 +1,166 @@
+#
+# Copyright (C) 2020 Arm Mbed. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+"""Compact binary form of the offline board database snapshot.
+
+The JSON snapshot is compiled at build time into a file which can be memory-mapped and searched by product code
+without decoding the whole database. All integers are little-endian. The file is laid out as:
+
+- A header: magic bytes, format version, number of records, and the size and SHA-256 digest of the JSON snapshot
+  it was compiled from. The size and digest are used to detect a compiled snapshot which is out of date.
+- Fixed-width records, sorted by product code, each holding an (offset, length) pair into the string table for
+  every field in `FIELDS`. Boards sharing a product code keep their order from the JSON snapshot.
+- A string table of UTF-8 encoded, deduplicated strings. Tuple fields are stored as JSON arrays.
+"""
+import hashlib
+import json
+import mmap
+import pathlib
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+MAGIC = b"MBDB"
+FORMAT_VERSION = 1
+FIELDS = (
+    "product_code",
+    "board_type",
+    "board_name",
+    "target_type",
+    "slug",
+    "build_variant",
+    "mbed_os_support",
+    "mbed_enabled",
+)
+TUPLE_FIELDS = frozenset(("build_variant", "mbed_os_support", "mbed_enabled"))
+
+_HEADER = struct.Struct("<4sHxxIQ32s")
+_RECORD = struct.Struct(f"<{2 * len(FIELDS)}I")
+
+
+def compile_snapshot(snapshot_path: pathlib.Path, output_path: pathlib.Path) -> None:
+    """Compile the JSON board database snapshot into its binary form.
+
+    Args:
+        snapshot_path: path to the JSON snapshot.
+        output_path: path the compiled snapshot is written to.
+    """
+    snapshot_bytes = snapshot_path.read_bytes()
+    board_entries = json.loads(snapshot_bytes)
+    strings = bytearray()
+    string_offsets: Dict[bytes, int] = {}
+
+    def add_string(value: str) -> Tuple[int, int]:
+        encoded = value.encode("utf-8")
+        if encoded not in string_offsets:
+            string_offsets[encoded] = len(strings)
+            strings.extend(encoded)
+        return string_offsets[encoded], len(encoded)
+
+    records = []
+    for entry in board_entries:
+        record: List[int] = []
+        for field in FIELDS:
+            value = entry.get(field, [] if field in TUPLE_FIELDS else "")
+            record.extend(add_string(json.dumps(value) if field in TUPLE_FIELDS else value))
+        records.append((entry.get("product_code", "").encode("utf-8"), record))
+    # sorted() is stable, so boards sharing a product code keep their snapshot order.
+    records.sort(key=lambda product_code_and_record: product_code_and_record[0])
+
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, len(records), len(snapshot_bytes), hashlib.sha256(snapshot_bytes).digest()
+    )
+    output_path.write_bytes(header + b"".join(_RECORD.pack(*record) for _, record in records) + bytes(strings))
+
+
+class CompiledSnapshot:
+    """Read access to a compiled board database snapshot."""
+
+    @classmethod
+    def open(cls, compiled_path: pathlib.Path, snapshot_path: pathlib.Path) -> Optional["CompiledSnapshot"]:
+        """Memory-map a compiled snapshot, checking it is up to date with the JSON snapshot.
+
+        Args:
+            compiled_path: path to the compiled snapshot.
+            snapshot_path: path to the JSON snapshot the compiled snapshot should have been built from.
+
+        Returns:
+            The compiled snapshot, or None if it is absent, invalid or was compiled from a different JSON snapshot.
+        """
+        try:
+            with compiled_path.open("rb") as compiled_file:
+                buffer = mmap.mmap(compiled_file.fileno(), 0, access=mmap.ACCESS_READ)
+            snapshot_size = snapshot_path.stat().st_size
+        except (OSError, ValueError):
+            return None
+
+        if len(buffer) < _HEADER.size:
+            return None
+        magic, version, record_count, json_size, json_digest = _HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != FORMAT_VERSION or json_size != snapshot_size:
+            return None
+        if len(buffer) < _HEADER.size + record_count * _RECORD.size:
+            return None
+        try:
+            if hashlib.sha256(snapshot_path.read_bytes()).digest() != json_digest:
+                return None
+        except OSError:
+            return None
+        return cls(buffer, record_count)
+
+    def __init__(self, buffer: Any, record_count: int) -> None:
+        """Initialise with the contents of a compiled snapshot.
+
+        Args:
+            buffer: the compiled snapshot, usually memory-mapped.
+            record_count: the number of records in the snapshot.
+        """
+        self._buffer = buffer
+        self._record_count = record_count
+        self._strings_offset = _HEADER.size + record_count * _RECORD.size
+
+    def __len__(self) -> int:
+        """Return the number of boards in the snapshot."""
+        return self._record_count
+
+    def find_by_product_code(self, product_code: str) -> Optional[Dict[str, Any]]:
+        """Binary search for the first board entry with the given product code.
+
+        Args:
+            product_code: the product code to look up.
+
+        Returns:
+            The board entry in the same form as in the JSON snapshot, or None if there is no match.
+        """
+        wanted = product_code.encode("utf-8")
+        low, high = 0, self._record_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._product_code_at(middle) < wanted:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._record_count and self._product_code_at(low) == wanted:
+            return self._entry_at(low)
+        return None
+
+    def _record_at(self, index: int) -> Tuple[int, ...]:
+        return _RECORD.unpack_from(self._buffer, _HEADER.size + index * _RECORD.size)
+
+    def _string(self, offset: int, length: int) -> bytes:
+        start = self._strings_offset + offset
+        end = start + length
+        return bytes(self._buffer[start:end])
+
+    def _product_code_at(self, index: int) -> bytes:
+        # The product code is the first field of each record.
+        offset, length = struct.unpack_from("<2I", self._buffer, _HEADER.size + index * _RECORD.size)
+        return self._string(offset, length)
+
+    def _entry_at(self, index: int) -> Dict[str, Any]:
+        record = self._record_at(index)
+        entry: Dict[str, Any] = {}
+        for position, field in enumerate(FIELDS):
+            value = self._string(record[2 * position], record[2 * position + 1]).decode("utf-8")
+            entry[field] = json.loads(value) if field in TUPLE_FIELDS else value
+        return entry
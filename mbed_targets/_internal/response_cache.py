@@ -0,0 +1,112 @@
+#
+# Copyright (C) 2020 Arm Mbed. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+"""On-disk cache of HTTP responses, used to avoid downloading the online board database repeatedly.
+
+Each response is stored in a single file: a line of JSON metadata holding the validators sent by the server
+(`ETag` and `Last-Modified`), followed by the raw response body. The modification time of the file records
+when the response was last known to be current. Files are written to a temporary file and then renamed over
+the previous version, so readers never see a partially written response.
+"""
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A response read from the cache.
+
+    Attributes:
+        body: The raw response body.
+        etag: The `ETag` header sent with the response, if any.
+        last_modified: The `Last-Modified` header sent with the response, if any.
+        age: Number of seconds since the response was last known to be current.
+    """
+
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    age: float
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Return the headers asking the server to only send the resource if it differs from this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Cache of responses, stored in a directory and keyed by an arbitrary string such as the request URL."""
+
+    def __init__(self, cache_dir: pathlib.Path) -> None:
+        """Initialise with the directory the responses are stored in.
+
+        Args:
+            cache_dir: directory for the cached responses, created when the first response is stored.
+        """
+        self._cache_dir = cache_dir
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for a key, or None if there isn't one."""
+        path = self._path_for(key)
+        try:
+            with path.open("rb") as cache_file:
+                age = time.time() - os.fstat(cache_file.fileno()).st_mtime
+                metadata = json.loads(cache_file.readline())
+                body = cache_file.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as error:
+            logger.debug(f"Ignoring unreadable cached response '{path}': {error}")
+            return None
+        if not isinstance(metadata, dict) or metadata.get("size") != len(body):
+            logger.debug(f"Ignoring incomplete cached response '{path}'.")
+            return None
+        return CachedResponse(
+            body=body, etag=metadata.get("etag"), last_modified=metadata.get("last_modified"), age=age
+        )
+
+    def put(self, key: str, body: bytes, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Store a response, replacing any previous response for the key.
+
+        Failures to write the cache are logged and otherwise ignored.
+        """
+        metadata = {"etag": etag, "last_modified": last_modified, "size": len(body)}
+        path = self._path_for(key)
+        temp_path = None
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=self._cache_dir, prefix=path.name, delete=False) as temp_file:
+                temp_path = temp_file.name
+                temp_file.write(json.dumps(metadata).encode("utf-8") + b"\n")
+                temp_file.write(body)
+            os.replace(temp_path, path)
+        except OSError as error:
+            logger.debug(f"Failed to cache response in '{path}': {error}")
+            if temp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(temp_path)
+
+    def refresh(self, key: str) -> None:
+        """Record that the cached response for a key is still current."""
+        try:
+            os.utime(self._path_for(key))
+        except OSError as error:
+            logger.debug(f"Failed to refresh cached response: {error}")
+
+    def _path_for(self, key: str) -> pathlib.Path:
+        return self._cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.response"
@@ -3,11 +3,13 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 """Interface to the Board Database."""
+import itertools
 import json
+import threading
 
 from dataclasses import asdict
 from collections.abc import Set
-from typing import Iterator, Iterable, Any, Callable
+from typing import Iterator, Iterable, Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 from mbed_targets._internal import board_database
 
@@ -20,16 +22,31 @@ class Boards(Set):
 
     Boards is initialised with an Iterable[Board]. The classmethods
     can be used to construct Boards with data from either the online or offline database.
+
+    Boards keep the order in which they were given, while membership tests and set operations
+    are backed by a hashed set of the boards.
     """
 
     @classmethod
     def from_offline_database(cls) -> "Boards":
         """Initialise with the offline board database.
 
+        The loaded boards are cached for the lifetime of the process and reused by subsequent calls, until
+        the snapshot file changes on disk or `clear_cache` is called.
+
         Raises:
             BoardDatabaseError: Could not retrieve data from the board database.
         """
-        return cls(Board.from_offline_board_entry(b) for b in board_database.get_offline_board_data())
+        global _offline_database_cache
+        snapshot_key = _get_snapshot_key()
+        with _offline_database_lock:
+            if _offline_database_cache is not None and _offline_database_cache[0] == snapshot_key:
+                return _offline_database_cache[1]
+
+        boards = cls(Board.from_offline_board_entry(b) for b in board_database.get_offline_board_data())
+        with _offline_database_lock:
+            _offline_database_cache = (snapshot_key, boards)
+        return boards
 
     @classmethod
     def from_online_database(cls) -> "Boards":
@@ -47,6 +64,8 @@ class Boards(Set):
             boards_data: iterable of board data from a board database source.
         """
         self._boards_data = tuple(boards_data)
+        self._boards_set = frozenset(self._boards_data)
+        self._indexes: Dict[str, Dict[Hashable, Tuple[Board, ...]]] = {}
 
     def __iter__(self) -> Iterator["Board"]:
         """Yield an Board on each iteration."""
@@ -66,7 +85,30 @@ class Boards(Set):
         if not isinstance(board, Board):
             return False
 
-        return any(x == board for x in self)
+        return board in self._boards_set
+
+    def __eq__(self, other: object) -> bool:
+        """Check if two collections contain the same boards, regardless of order."""
+        if isinstance(other, Boards):
+            return self._boards_set == other._boards_set
+        return super().__eq__(other)
+
+    def __sub__(self, other: Iterable) -> "Boards":
+        """Return the boards which are not in `other`, keeping their order."""
+        other_set = _as_hashed_set(other)
+        return Boards(board for board in self if board not in other_set)
+
+    def __and__(self, other: Iterable) -> "Boards":
+        """Return the boards which are also in `other`, keeping their order."""
+        other_set = _as_hashed_set(other)
+        return Boards(board for board in self if board in other_set)
+
+    def __or__(self, other: Iterable) -> "Boards":
+        """Return the boards in either collection, followed by the boards only found in `other`."""
+        return Boards(itertools.chain(self, (board for board in other if board not in self._boards_set)))
+
+    __rand__ = __and__
+    __ror__ = __or__
 
     def get_board(self, matching: Callable) -> Board:
         """Returns first Board for which `matching` returns True.
@@ -82,6 +124,90 @@ class Boards(Set):
         except StopIteration:
             raise UnknownBoard()
 
+    def get_by_product_code(self, product_code: str) -> Board:
+        """Returns first Board with the given product code.
+
+        Args:
+            product_code: The product code to look up.
+
+        Raises:
+            UnknownBoard: the given product code was not found in the board database.
+        """
+        return self._get_first_indexed("product_code", product_code)
+
+    def get_by_online_id(self, slug: str, target_type: str) -> Board:
+        """Returns first Board with the given online id.
+
+        Args:
+            slug: The slug to look up, compared case insensitively.
+            target_type: The target type to look up, normally one of `platform` or `module`.
+
+        Raises:
+            UnknownBoard: the given online id was not found in the board database.
+        """
+        return self._get_first_indexed("online_id", (slug.casefold(), target_type))
+
+    def get_all_by_board_type(self, board_type: str) -> "Boards":
+        """Returns all the boards with the given board type, in database order.
+
+        Args:
+            board_type: The board type to look up.
+        """
+        return Boards(self._get_index("board_type").get(board_type, ()))
+
     def json_dump(self) -> str:
         """Return the contents of the board database as a json string."""
         return json.dumps([asdict(b) for b in self], indent=4)
+
+    def _get_first_indexed(self, index_name: str, key: Hashable) -> Board:
+        try:
+            return self._get_index(index_name)[key][0]
+        except KeyError:
+            raise UnknownBoard()
+
+    def _get_index(self, index_name: str) -> Dict[Hashable, Tuple[Board, ...]]:
+        """Return the named index, building it on first use.
+
+        Each index maps a key to the boards with that key, in database order.
+        """
+        index = self._indexes.get(index_name)
+        if index is None:
+            key_for_board = _INDEX_KEYS[index_name]
+            grouped: Dict[Hashable, List[Board]] = {}
+            for board in self._boards_data:
+                grouped.setdefault(key_for_board(board), []).append(board)
+            index = self._indexes[index_name] = {key: tuple(boards) for key, boards in grouped.items()}
+        return index
+
+
+def _as_hashed_set(boards: Iterable) -> Any:
+    """Return a collection with hash based membership tests containing the given boards."""
+    if isinstance(boards, Boards):
+        return boards._boards_set
+    if isinstance(boards, (set, frozenset)):
+        return boards
+    return frozenset(boards)
+
+
+_INDEX_KEYS: Dict[str, Callable[[Board], Hashable]] = {
+    "product_code": lambda board: board.product_code,
+    "online_id": lambda board: (board.slug.casefold(), board.target_type),
+    "board_type": lambda board: board.board_type,
+}
+
+_offline_database_lock = threading.Lock()
+_offline_database_cache: Optional[Tuple[Tuple[str, int, int], Boards]] = None
+
+
+def clear_cache() -> None:
+    """Discard the cached offline board database, forcing the next lookup to reload the snapshot."""
+    global _offline_database_cache
+    with _offline_database_lock:
+        _offline_database_cache = None
+
+
+def _get_snapshot_key() -> Tuple[str, int, int]:
+    """Identify the current version of the offline snapshot by its path, modification time and size."""
+    snapshot_path = board_database.get_board_database_path()
+    stat = snapshot_path.stat()
+    return str(snapshot_path), stat.st_mtime_ns, stat.st_size
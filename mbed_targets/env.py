@@ -18,11 +18,16 @@ by any values previously set in your environment.
    Do not upload `.env` files containing private tokens to version control! If you use this package
    as a dependency of your project, please ensure to include the `.env` in your `.gitignore`.
 """
+import logging
 import os
+import pathlib
+import sys
 import dotenv
 
 dotenv.load_dotenv(dotenv.find_dotenv(usecwd=True))
 
+logger = logging.getLogger(__name__)
+
 
 class Env:
     """Provides access to environment variables.
@@ -67,6 +72,90 @@ class Env:
         """
         return os.getenv("MBED_DATABASE_MODE", "AUTO")
 
+    @property
+    def MBED_TARGETS_CACHE_DIR(self) -> str:
+        """Directory in which mbed-targets caches data between runs.
+
+        Defaults to an `mbed-targets` directory in the user's cache directory, e.g. `~/.cache/mbed-targets` on Linux.
+        """
+        return os.getenv("MBED_TARGETS_CACHE_DIR", str(_default_cache_dir()))
+
+    @property
+    def MBED_API_CACHE_TTL(self) -> int:
+        """Number of seconds a cached response from the online board database is used without contacting the API.
+
+        Responses from the online database are cached in `MBED_TARGETS_CACHE_DIR`. Within this time the cached
+        response is used as is. After it, the API is asked whether the board database changed since the cached
+        response, which costs a request but not the download when nothing changed.
+
+        Defaults to `0`, meaning the API is always asked. Set it to a negative value to disable the cache.
+        """
+        return _get_int("MBED_API_CACHE_TTL", 0)
+
+    @property
+    def MBED_API_CONNECT_TIMEOUT(self) -> float:
+        """Number of seconds to wait for a connection to the online board database to be established.
+
+        Defaults to `10`.
+        """
+        return _get_float("MBED_API_CONNECT_TIMEOUT", 10.0)
+
+    @property
+    def MBED_API_READ_TIMEOUT(self) -> float:
+        """Number of seconds to wait for the online board database to send data before giving up.
+
+        Defaults to `60`.
+        """
+        return _get_float("MBED_API_READ_TIMEOUT", 60.0)
+
+    @property
+    def MBED_API_MAX_RETRIES(self) -> int:
+        """Number of times a failed request to the online board database is retried.
+
+        Requests are retried on connection errors and on responses with status 429 or 5xx. Defaults to `3`.
+        """
+        return _get_int("MBED_API_MAX_RETRIES", 3)
+
+    @property
+    def MBED_API_RETRY_BACKOFF(self) -> float:
+        """Backoff factor, in seconds, for retried requests to the online board database.
+
+        The wait before the n-th retry grows exponentially, as `MBED_API_RETRY_BACKOFF * 2 ** (n - 1)`.
+        Defaults to `0.5`.
+        """
+        return _get_float("MBED_API_RETRY_BACKOFF", 0.5)
+
+
+def _default_cache_dir() -> pathlib.Path:
+    if sys.platform == "win32":
+        base_dir = pathlib.Path(os.getenv("LOCALAPPDATA") or pathlib.Path.home() / "AppData" / "Local")
+        return base_dir / "mbed-targets" / "Cache"
+    if sys.platform == "darwin":
+        return pathlib.Path.home() / "Library" / "Caches" / "mbed-targets"
+    return pathlib.Path(os.getenv("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache") / "mbed-targets"
+
+
+def _get_int(variable_name: str, default: int) -> int:
+    value = os.getenv(variable_name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring {variable_name}={value!r} as it is not an integer, using {default} instead.")
+        return default
+
+
+def _get_float(variable_name: str, default: float) -> float:
+    value = os.getenv(variable_name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Ignoring {variable_name}={value!r} as it is not a number, using {default} instead.")
+        return default
+
 
 env = Env()
 """Instance of `Env` class."""
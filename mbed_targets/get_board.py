@@ -8,8 +8,9 @@ An instance of `mbed_targets.board.Board` can be retrieved by calling one of the
 """
 import logging
 from enum import Enum
-from typing import Callable
+from typing import Callable, Optional
 
+from mbed_targets._internal import board_database
 from mbed_targets.env import env
 from mbed_targets.exceptions import UnknownBoard, UnsupportedMode
 from mbed_targets.board import Board
@@ -28,7 +29,10 @@ def get_board_by_product_code(product_code: str) -> Board:
     Raises:
         UnknownBoard: a board with a matching product code was not found.
     """
-    return get_board(lambda board: board.product_code == product_code)
+    return _lookup_board(
+        lambda boards: boards.get_by_product_code(product_code),
+        offline_lookup=lambda: _get_offline_board_by_product_code(product_code),
+    )
 
 
 def get_board_by_online_id(slug: str, target_type: str) -> Board:
@@ -41,8 +45,7 @@ def get_board_by_online_id(slug: str, target_type: str) -> Board:
     Raises:
         UnknownBoard: a board with a matching slug and target type could not be found.
     """
-    matched_slug = slug.casefold()
-    return get_board(lambda board: board.slug.casefold() == matched_slug and board.target_type == target_type)
+    return _lookup_board(lambda boards: boards.get_by_online_id(slug=slug, target_type=target_type))
 
 
 def get_board(matching: Callable) -> Board:
@@ -53,6 +56,20 @@ def get_board(matching: Callable) -> Board:
     Args:
         matching: A function which will be called to test matching conditions for each board in database.
 
+    Raises:
+        UnknownBoard: a board matching the criteria could not be found in the board database.
+    """
+    return _lookup_board(lambda boards: boards.get_board(matching))
+
+
+def _lookup_board(lookup: Callable[[Boards], Board], offline_lookup: Optional[Callable[[], Board]] = None) -> Board:
+    """Runs `lookup` against the board databases selected by the configured database mode.
+
+    Args:
+        lookup: A function returning the requested board from a `Boards` instance, or raising `UnknownBoard`.
+        offline_lookup: A function returning the requested board from the offline database, or raising
+            `UnknownBoard`. Defaults to running `lookup` against the offline `Boards`.
+
     Raises:
         UnknownBoard: a board matching the criteria could not be found in the board database.
     """
@@ -60,17 +77,39 @@ def get_board(matching: Callable) -> Board:
 
     if database_mode == _DatabaseMode.OFFLINE:
         logger.info("Using the offline database (only) to identify boards.")
-        return Boards.from_offline_database().get_board(matching)
+        return _lookup_offline_board(lookup, offline_lookup)
 
     if database_mode == _DatabaseMode.ONLINE:
         logger.info("Using the online database (only) to identify boards.")
-        return Boards.from_online_database().get_board(matching)
+        return lookup(Boards.from_online_database())
     try:
         logger.info("Using the offline database to identify boards.")
-        return Boards.from_offline_database().get_board(matching)
+        return _lookup_offline_board(lookup, offline_lookup)
     except UnknownBoard:
         logger.info("Unable to identify a board using the offline database, trying the online database.")
-        return Boards.from_online_database().get_board(matching)
+        return lookup(Boards.from_online_database())
+
+
+def _lookup_offline_board(lookup: Callable[[Boards], Board], offline_lookup: Optional[Callable[[], Board]]) -> Board:
+    if offline_lookup is not None:
+        return offline_lookup()
+    return lookup(Boards.from_offline_database())
+
+
+def _get_offline_board_by_product_code(product_code: str) -> Board:
+    """Looks up a board in the compiled offline snapshot, falling back to the JSON snapshot if it is unavailable.
+
+    Raises:
+        UnknownBoard: a board with a matching product code was not found.
+    """
+    compiled_snapshot = board_database.get_compiled_offline_snapshot()
+    if compiled_snapshot is None:
+        return Boards.from_offline_database().get_by_product_code(product_code)
+
+    board_entry = compiled_snapshot.find_by_product_code(product_code)
+    if board_entry is None:
+        raise UnknownBoard()
+    return Board.from_offline_board_entry(board_entry)
 
 
 class _DatabaseMode(Enum):
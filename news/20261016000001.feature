@@ -0,0 +1 @@
+Cache the offline board database in memory, reloading it only when the snapshot file changes.
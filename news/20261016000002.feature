@@ -0,0 +1 @@
+Look up boards by product code and online id through hash indexes instead of scanning the whole database.
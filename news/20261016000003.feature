@@ -0,0 +1 @@
+Make membership tests and set operations on Boards hash based, speeding up comparisons of large board databases.
@@ -0,0 +1 @@
+Look up boards by product code in a compiled, memory-mapped copy of the offline board database instead of decoding the JSON snapshot.
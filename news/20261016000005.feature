@@ -0,0 +1 @@
+Cache responses from the online board database on disk and revalidate them with conditional requests, configured with MBED_TARGETS_CACHE_DIR and MBED_API_CACHE_TTL.
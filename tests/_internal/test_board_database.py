@@ -4,6 +4,10 @@
 #
 """Tests for `mbed_targets._internal.board_database`."""
 
+import os
+import pathlib
+import tempfile
+import time
 from unittest import TestCase, mock
 
 import requests_mock
@@ -11,9 +15,21 @@ import requests_mock
 # Unit under test
 import mbed_targets._internal.board_database as board_database
 from mbed_targets.env import env
+from tests.board_api_server import BoardApiServer
 
 
-class TestGetOnlineBoardData(TestCase):
+class IsolatedCacheTestCase(TestCase):
+    """Test case with the online database response cache in a temporary directory."""
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.dict(os.environ, {"MBED_TARGETS_CACHE_DIR": self.cache_dir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.cache_dir.cleanup)
+
+
+class TestGetOnlineBoardData(IsolatedCacheTestCase):
     """Tests for the method `board_database.get_online_board_data`."""
 
     @requests_mock.mock()
@@ -70,28 +86,182 @@ class TestGetOnlineBoardData(TestCase):
         board_data = board_database.get_online_board_data()
         self.assertEqual(42, board_data, "Target data should match the contents of the target API data")
 
-    @mock.patch("mbed_targets._internal.board_database.requests")
+    @mock.patch("mbed_targets._internal.board_database._get_session")
     @mock.patch("mbed_targets._internal.board_database.env", spec_set=env)
-    def test_auth_header_set_with_token(self, env, requests):
+    def test_auth_header_set_with_token(self, env, get_session):
         """Given an authorization token env variable, get is called with authorization header."""
         env.MBED_API_AUTH_TOKEN = "token"
+        env.MBED_API_CONNECT_TIMEOUT = 1.5
+        env.MBED_API_READ_TIMEOUT = 30.0
         header = {"Authorization": "Bearer token"}
         board_database._get_request()
-        requests.get.assert_called_once_with(board_database._BOARD_API, headers=header)
+        get_session().get.assert_called_once_with(board_database._BOARD_API, headers=header, timeout=(1.5, 30.0))
 
-    @mock.patch("mbed_targets._internal.board_database.requests")
-    def test_no_auth_header_set_with_empty_token_var(self, requests):
+    @mock.patch("mbed_targets._internal.board_database._get_session")
+    def test_no_auth_header_set_with_empty_token_var(self, get_session):
         """Given no authorization token env variable, get is called with no header."""
         board_database._get_request()
-        requests.get.assert_called_once_with(board_database._BOARD_API, headers=None)
+        get_session().get.assert_called_once_with(board_database._BOARD_API, headers=None, timeout=mock.ANY)
+
+    @mock.patch("mbed_targets._internal.board_database._get_session")
+    def test_raises_tools_error_on_connection_error(self, get_session):
+        get_session().get.side_effect = board_database.requests.exceptions.ConnectionError
+        with self.assertRaises(board_database.BoardAPIError):
+            board_database._get_request()
 
-    @mock.patch("mbed_targets._internal.board_database.requests.get")
-    def test_raises_tools_error_on_connection_error(self, get):
-        get.side_effect = board_database.requests.exceptions.ConnectionError
+    @mock.patch("mbed_targets._internal.board_database._get_session")
+    def test_raises_tools_error_on_timeout(self, get_session):
+        get_session().get.side_effect = board_database.requests.exceptions.ReadTimeout
         with self.assertRaises(board_database.BoardAPIError):
             board_database._get_request()
 
 
+@mock.patch.dict(os.environ, {"MBED_API_AUTH_TOKEN": ""})
+class TestOnlineBoardDataCache(IsolatedCacheTestCase):
+    """Tests for the on-disk cache used by `board_database.get_online_board_data`."""
+
+    def get_online_board_data(self, server):
+        with mock.patch.object(board_database, "_BOARD_API", server.url):
+            return board_database.get_online_board_data()
+
+    def test_revalidates_cached_response_by_default(self):
+        with BoardApiServer(board_data=[{"id": "1"}]) as server:
+            first = self.get_online_board_data(server)
+            second = self.get_online_board_data(server)
+
+        self.assertEqual(first, [{"id": "1"}])
+        self.assertEqual(second, first)
+        self.assertNotIn("If-None-Match", server.requests[0])
+        self.assertEqual(server.requests[1]["If-None-Match"], '"v1"')
+
+    def test_changed_response_replaces_cached_response(self):
+        with BoardApiServer(board_data=[{"id": "1"}]) as server:
+            self.get_online_board_data(server)
+            server.board_data, server.etag = [{"id": "2"}], '"v2"'
+            second = self.get_online_board_data(server)
+            server.board_data = [{"id": "3"}]
+            third = self.get_online_board_data(server)
+
+        self.assertEqual(second, [{"id": "2"}])
+        # The server claims the client's copy is current, so the cached response is used.
+        self.assertEqual(third, [{"id": "2"}])
+
+    @mock.patch.dict(os.environ, {"MBED_API_CACHE_TTL": "60"})
+    def test_replays_cached_response_within_ttl(self):
+        with BoardApiServer(board_data=[{"id": "1"}]) as server:
+            self.get_online_board_data(server)
+            server.board_data, server.etag = [{"id": "2"}], '"v2"'
+            second = self.get_online_board_data(server)
+
+        self.assertEqual(second, [{"id": "1"}])
+        self.assertEqual(len(server.requests), 1)
+
+    @mock.patch.dict(os.environ, {"MBED_API_CACHE_TTL": "60"})
+    def test_revalidates_cached_response_after_ttl(self):
+        with BoardApiServer(board_data=[{"id": "1"}]) as server:
+            self.get_online_board_data(server)
+            for cached_file in pathlib.Path(self.cache_dir.name).glob("**/*.response"):
+                os.utime(cached_file, (time.time() - 120, time.time() - 120))
+            self.get_online_board_data(server)
+            self.get_online_board_data(server)
+
+        # The 304 response marks the cached response as current again, so the third call does not reach the server.
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(server.requests[1]["If-None-Match"], '"v1"')
+
+    @mock.patch.dict(os.environ, {"MBED_API_CACHE_TTL": "-1"})
+    def test_negative_ttl_disables_cache(self):
+        with BoardApiServer(board_data=[{"id": "1"}]) as server:
+            self.get_online_board_data(server)
+            self.get_online_board_data(server)
+
+        self.assertNotIn("If-None-Match", server.requests[1])
+        self.assertEqual(list(pathlib.Path(self.cache_dir.name).glob("**/*.response")), [])
+
+    @mock.patch.dict(os.environ, {"MBED_API_CACHE_TTL": "60"})
+    def test_responses_are_cached_per_auth_token(self):
+        with BoardApiServer(board_data=[{"id": "public"}]) as server:
+            self.get_online_board_data(server)
+            server.board_data, server.etag = [{"id": "private"}], '"private"'
+            with mock.patch.dict(os.environ, {"MBED_API_AUTH_TOKEN": "token"}):
+                private = self.get_online_board_data(server)
+
+        self.assertEqual(private, [{"id": "private"}])
+
+    @mock.patch.dict(os.environ, {"MBED_API_MAX_RETRIES": "0"})
+    def test_error_responses_are_not_cached(self):
+        with BoardApiServer(board_data=[{"id": "1"}]) as server:
+            server.failures = [500]
+            with self.assertRaises(board_database.BoardAPIError):
+                self.get_online_board_data(server)
+
+        self.assertEqual(list(pathlib.Path(self.cache_dir.name).glob("**/*.response")), [])
+
+
+@mock.patch.dict(
+    os.environ, {"MBED_API_AUTH_TOKEN": "", "MBED_API_CACHE_TTL": "-1", "MBED_API_RETRY_BACKOFF": "0"}
+)
+class TestBoardApiSession(TestCase):
+    """Tests for the session used to make requests to the board API."""
+
+    def get_online_board_data(self, server):
+        with mock.patch.object(board_database, "_BOARD_API", server.url):
+            return board_database.get_online_board_data()
+
+    def test_session_is_shared(self):
+        self.assertIs(board_database._get_session(), board_database._get_session())
+
+    def test_session_is_recreated_when_retry_configuration_changes(self):
+        session = board_database._get_session()
+        with mock.patch.dict(os.environ, {"MBED_API_MAX_RETRIES": "7"}):
+            self.assertIsNot(board_database._get_session(), session)
+
+    def test_connections_are_kept_alive(self):
+        with BoardApiServer(board_data=[{"id": "1"}]) as server:
+            self.get_online_board_data(server)
+            self.get_online_board_data(server)
+
+        self.assertEqual(len(server.client_addresses), 2)
+        self.assertEqual(server.client_addresses[0], server.client_addresses[1])
+
+    @mock.patch.dict(os.environ, {"MBED_API_MAX_RETRIES": "2"})
+    def test_retries_server_errors(self):
+        with BoardApiServer(board_data=[{"id": "1"}]) as server:
+            server.failures = [503, 429]
+            board_data = self.get_online_board_data(server)
+
+        self.assertEqual(board_data, [{"id": "1"}])
+        self.assertEqual(len(server.requests), 3)
+
+    @mock.patch.dict(os.environ, {"MBED_API_MAX_RETRIES": "1"})
+    def test_raises_when_retries_are_exhausted(self):
+        with BoardApiServer(board_data=[{"id": "1"}]) as server:
+            server.failures = [500, 502, 503]
+            with self.assertRaises(board_database.BoardAPIError):
+                self.get_online_board_data(server)
+
+        self.assertEqual(len(server.requests), 2)
+
+    @mock.patch.dict(os.environ, {"MBED_API_MAX_RETRIES": "0"})
+    def test_client_errors_are_not_retried(self):
+        with BoardApiServer(board_data=[{"id": "1"}]) as server:
+            server.failures = [404]
+            with self.assertRaises(board_database.BoardAPIError):
+                self.get_online_board_data(server)
+
+        self.assertEqual(len(server.requests), 1)
+
+    @mock.patch.dict(os.environ, {"MBED_API_MAX_RETRIES": "0", "MBED_API_READ_TIMEOUT": "0.05"})
+    def test_slow_responses_time_out(self):
+        with BoardApiServer(board_data=[{"id": "1"}]) as server:
+            server.delay = 0.5
+            start = time.monotonic()
+            with self.assertRaises(board_database.BoardAPIError):
+                self.get_online_board_data(server)
+
+        self.assertLess(time.monotonic() - start, 0.5)
+
+
 class TestGetOfflineTargetData(TestCase):
     """Tests for the method get_offline_target_data."""
 
@@ -111,6 +281,26 @@ class TestGetOfflineTargetData(TestCase):
             board_database.get_offline_board_data()
 
 
+class TestGetCompiledOfflineSnapshot(TestCase):
+    def setUp(self):
+        board_database._compiled_snapshot_cache = None
+
+    def tearDown(self):
+        board_database._compiled_snapshot_cache = None
+
+    def test_packaged_compiled_snapshot_is_used(self):
+        compiled_snapshot = board_database.get_compiled_offline_snapshot()
+
+        self.assertIsNotNone(compiled_snapshot)
+        self.assertIs(compiled_snapshot, board_database.get_compiled_offline_snapshot())
+
+    @mock.patch("mbed_targets._internal.board_database.get_compiled_board_database_path")
+    def test_returns_none_without_compiled_snapshot(self, get_compiled_board_database_path):
+        get_compiled_board_database_path.return_value = pathlib.Path("i_dont_exist.bin")
+
+        self.assertIsNone(board_database.get_compiled_offline_snapshot())
+
+
 class TestGetLocalTargetDatabaseFile(TestCase):
     def test_returns_path_to_targets(self):
         path = board_database.get_board_database_path()
@@ -0,0 +1,95 @@
+#
+# Copyright (C) 2020 Arm Mbed. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+"""Tests for `mbed_targets._internal.compiled_board_database`."""
+import json
+import pathlib
+import tempfile
+from unittest import TestCase
+
+from mbed_targets._internal import board_database
+from mbed_targets._internal.compiled_board_database import CompiledSnapshot, compile_snapshot
+
+BOARD_ENTRIES = [
+    {
+        "board_type": "K64F",
+        "board_name": "FRDM-K64F",
+        "product_code": "0240",
+        "target_type": "platform",
+        "slug": "FRDM-K64F",
+        "build_variant": [],
+        "mbed_os_support": ["Mbed OS 5.15", "Mbed OS 6"],
+        "mbed_enabled": ["Advanced"],
+    },
+    {"board_type": "NINA_B1", "board_name": "u-blox NINA-B1", "product_code": "0455", "slug": "nina-b1"},
+    {"board_type": "NINA_B1_DUPLICATE", "board_name": "Duplicate", "product_code": "0455"},
+    {"board_type": "DISCO", "board_name": "Disco ünïcödé", "product_code": "0100"},
+]
+
+
+class TestCompiledSnapshot(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.snapshot_path = pathlib.Path(self.tmp_dir.name, "snapshot.json")
+        self.compiled_path = pathlib.Path(self.tmp_dir.name, "snapshot.bin")
+        self.snapshot_path.write_text(json.dumps(BOARD_ENTRIES, indent=4))
+        compile_snapshot(self.snapshot_path, self.compiled_path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_finds_board_entry_by_product_code(self):
+        compiled_snapshot = CompiledSnapshot.open(self.compiled_path, self.snapshot_path)
+
+        self.assertEqual(len(compiled_snapshot), len(BOARD_ENTRIES))
+        self.assertEqual(compiled_snapshot.find_by_product_code("0240"), BOARD_ENTRIES[0])
+        self.assertEqual(compiled_snapshot.find_by_product_code("0100")["board_name"], "Disco ünïcödé")
+
+    def test_returns_first_entry_for_duplicated_product_code(self):
+        compiled_snapshot = CompiledSnapshot.open(self.compiled_path, self.snapshot_path)
+
+        self.assertEqual(compiled_snapshot.find_by_product_code("0455")["board_type"], "NINA_B1")
+
+    def test_missing_fields_have_default_values(self):
+        compiled_snapshot = CompiledSnapshot.open(self.compiled_path, self.snapshot_path)
+
+        entry = compiled_snapshot.find_by_product_code("0100")
+
+        self.assertEqual(entry["target_type"], "")
+        self.assertEqual(entry["mbed_enabled"], [])
+
+    def test_returns_none_for_unknown_product_code(self):
+        compiled_snapshot = CompiledSnapshot.open(self.compiled_path, self.snapshot_path)
+
+        for product_code in ("", "0000", "0300", "9999"):
+            self.assertIsNone(compiled_snapshot.find_by_product_code(product_code))
+
+    def test_stale_compiled_snapshot_is_not_opened(self):
+        self.snapshot_path.write_text(json.dumps(BOARD_ENTRIES[:1], indent=4))
+
+        self.assertIsNone(CompiledSnapshot.open(self.compiled_path, self.snapshot_path))
+
+    def test_same_size_but_different_snapshot_is_not_opened(self):
+        self.snapshot_path.write_text(self.snapshot_path.read_text().replace("0240", "0241"))
+
+        self.assertIsNone(CompiledSnapshot.open(self.compiled_path, self.snapshot_path))
+
+    def test_missing_compiled_snapshot_is_not_opened(self):
+        self.compiled_path.unlink()
+
+        self.assertIsNone(CompiledSnapshot.open(self.compiled_path, self.snapshot_path))
+
+    def test_invalid_compiled_snapshot_is_not_opened(self):
+        for contents in (b"", b"not a compiled snapshot", b"X" * 100):
+            self.compiled_path.write_bytes(contents)
+            self.assertIsNone(CompiledSnapshot.open(self.compiled_path, self.snapshot_path))
+
+
+class TestPackagedCompiledSnapshot(TestCase):
+    def test_packaged_compiled_snapshot_is_up_to_date(self):
+        compiled_snapshot = CompiledSnapshot.open(
+            board_database.get_compiled_board_database_path(), board_database.get_board_database_path()
+        )
+
+        self.assertIsNotNone(compiled_snapshot, "Recompile the snapshot after updating the JSON snapshot.")
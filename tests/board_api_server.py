@@ -0,0 +1,96 @@
+#
+# Copyright (C) 2020 Arm Mbed. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+"""Local stand-in for the online board API, serving canned responses over HTTP."""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class BoardApiServer:
+    """HTTP server answering GET requests with board data, supporting `ETag` based conditional requests.
+
+    Use as a context manager; `url` is the address to send requests to. `requests` records the headers
+    and `client_addresses` the peer address of each request received. Failures can be injected by listing
+    the status codes of the first responses in `failures`, and latency by setting `delay` in seconds.
+    """
+
+    def __init__(self, board_data: Any = None, etag: Optional[str] = '"v1"') -> None:
+        """Initialise with the board data to serve in the `data` field of the response body."""
+        self.board_data = board_data if board_data is not None else []
+        self.etag = etag
+        self.failures: List[int] = []
+        self.delay = 0.0
+        self.requests: List[Dict[str, str]] = []
+        self.client_addresses: List[Tuple[str, int]] = []
+        self._server = _ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.01,), daemon=True)
+
+    @property
+    def url(self) -> str:
+        """The URL of the board API served."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v4/targets"
+
+    def __enter__(self) -> "BoardApiServer":
+        """Start serving requests."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop serving requests."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def respond(self, handler: BaseHTTPRequestHandler) -> None:
+        """Answer a request with the board data, or 304 if the client's copy is current."""
+        time.sleep(self.delay)
+        if self.failures:
+            self.send_empty_response(handler, self.failures.pop(0))
+            return
+        if self.etag is not None and handler.headers.get("If-None-Match") == self.etag:
+            self.send_empty_response(handler, 304)
+            return
+        body = json.dumps({"data": self.board_data}).encode("utf-8")
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(body)))
+        if self.etag is not None:
+            handler.send_header("ETag", self.etag)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    @staticmethod
+    def send_empty_response(handler: BaseHTTPRequestHandler, status: int) -> None:
+        """Answer a request with the given status code and no body."""
+        handler.send_response(status)
+        handler.send_header("Content-Length", "0")
+        handler.end_headers()
+
+    def _make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                server.requests.append(dict(self.headers))
+                server.client_addresses.append(self.client_address)
+                try:
+                    server.respond(self)
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
@@ -5,19 +5,28 @@
 """Tests for `mbed_targets.boards`."""
 
 import json
+import os
+import pathlib
+import tempfile
 from dataclasses import asdict
 from unittest import mock, TestCase
 
 from mbed_targets import Board
-from mbed_targets.boards import Boards
+from mbed_targets.boards import Boards, clear_cache
 from mbed_targets.exceptions import UnknownBoard
-from tests.factories import make_dummy_internal_board_data
+from tests.factories import make_board, make_dummy_internal_board_data
 
 
 @mock.patch("mbed_targets._internal.board_database.get_online_board_data")
 class TestBoards(TestCase):
     """Tests for the class `Boards`."""
 
+    def setUp(self):
+        clear_cache()
+
+    def tearDown(self):
+        clear_cache()
+
     def test_iteration_is_repeatable(self, mocked_get_board_data):
         """Test Boards is an iterable and not an exhaustible iterator."""
         fake_board_data = make_dummy_internal_board_data()
@@ -78,6 +87,67 @@ class TestBoards(TestCase):
         with self.assertRaises(UnknownBoard):
             boards.get_board(lambda b: b.product_code == "unknown")
 
+    def test_get_by_product_code(self, mocked_get_board_data):
+        """Check a Board can be looked up by product code, returning the first match."""
+        boards = Boards(
+            [
+                make_board(product_code="0100", board_type="FIRST"),
+                make_board(product_code="0200"),
+                make_board(product_code="0100", board_type="SECOND"),
+            ]
+        )
+
+        self.assertEqual(boards.get_by_product_code("0100").board_type, "FIRST")
+        with self.assertRaises(UnknownBoard):
+            boards.get_by_product_code("0300")
+
+    def test_get_by_online_id(self, mocked_get_board_data):
+        """Check a Board can be looked up by slug, matched case insensitively, and target type."""
+        board = make_board(slug="SlUg", target_type="platform")
+        boards = Boards([make_board(slug="slug", target_type="module"), board])
+
+        self.assertEqual(boards.get_by_online_id(slug="sLuG", target_type="platform"), board)
+        with self.assertRaises(UnknownBoard):
+            boards.get_by_online_id(slug="other", target_type="platform")
+
+    def test_get_all_by_board_type(self, mocked_get_board_data):
+        """Check all Boards of a board type are returned in database order."""
+        first = make_board(board_type="K64F", product_code="0240")
+        second = make_board(board_type="K64F", product_code="0241")
+        boards = Boards([first, make_board(board_type="OTHER"), second])
+
+        self.assertEqual(list(boards.get_all_by_board_type("K64F")), [first, second])
+        self.assertEqual(len(boards.get_all_by_board_type("UNKNOWN")), 0)
+
+    def test_set_operations_keep_board_order(self, mocked_get_board_data):
+        """Check set operations return Boards ordered as in the left hand operand."""
+        a, b, c, d = (make_board(product_code=code) for code in ("0400", "0300", "0200", "0100"))
+        left = Boards([a, b, c])
+        right = Boards([d, c, b])
+
+        self.assertEqual(list(left - right), [a])
+        self.assertEqual(list(left & right), [b, c])
+        self.assertEqual(list(left | right), [a, b, c, d])
+        self.assertIsInstance(left - right, Boards)
+
+    def test_set_operations_with_other_iterables(self, mocked_get_board_data):
+        """Check set operations accept builtin sets and lists of boards."""
+        a, b = make_board(product_code="0100"), make_board(product_code="0200")
+        boards = Boards([a, b])
+
+        self.assertEqual(list(boards - {b}), [a])
+        self.assertEqual(list(boards & [b]), [b])
+        self.assertEqual(list({b} & boards), [b])
+        self.assertEqual(list(boards | [make_board(product_code="0100")]), [a, b])
+
+    def test_equality_ignores_order(self, mocked_get_board_data):
+        """Check Boards compare equal when they contain the same boards."""
+        a, b = make_board(product_code="0100"), make_board(product_code="0200")
+
+        self.assertEqual(Boards([a, b]), Boards([b, a]))
+        self.assertEqual(Boards([a, b]), {a, b})
+        self.assertNotEqual(Boards([a, b]), Boards([a]))
+
     @mock.patch("mbed_targets._internal.board_database.get_offline_board_data")
     def test_json_dump_from_raw_and_filtered_data(self, mocked_get_offline_board_data, mocked_get_online_board_data):
         raw_board_data = [
@@ -107,3 +177,56 @@ class TestBoards(TestCase):
         )
 
         self.assertEqual(json_str_from_filtered, json.dumps([t1_filt.__dict__, t2_filt.__dict__], indent=4))
+
+
+@mock.patch("mbed_targets._internal.board_database.get_board_database_path")
+class TestOfflineDatabaseCache(TestCase):
+    """Tests for the caching of `Boards.from_offline_database`."""
+
+    def setUp(self):
+        clear_cache()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.snapshot_path = pathlib.Path(self.tmp_dir.name, "snapshot.json")
+        self.snapshot_path.write_text(json.dumps([{"product_code": "0100"}]))
+
+    def tearDown(self):
+        clear_cache()
+        self.tmp_dir.cleanup()
+
+    def test_reuses_loaded_boards(self, get_board_database_path):
+        get_board_database_path.return_value = self.snapshot_path
+
+        first = Boards.from_offline_database()
+        second = Boards.from_offline_database()
+
+        self.assertIs(first, second)
+
+    def test_reloads_when_snapshot_changes(self, get_board_database_path):
+        get_board_database_path.return_value = self.snapshot_path
+        first = Boards.from_offline_database()
+
+        self.snapshot_path.write_text(json.dumps([{"product_code": "0100"}, {"product_code": "0200"}]))
+        second = Boards.from_offline_database()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(len(second), 2)
+
+    def test_reloads_when_snapshot_touched(self, get_board_database_path):
+        get_board_database_path.return_value = self.snapshot_path
+        first = Boards.from_offline_database()
+
+        stat = self.snapshot_path.stat()
+        os.utime(self.snapshot_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        second = Boards.from_offline_database()
+
+        self.assertIsNot(first, second)
+
+    def test_clear_cache_forces_reload(self, get_board_database_path):
+        get_board_database_path.return_value = self.snapshot_path
+        first = Boards.from_offline_database()
+
+        clear_cache()
+        second = Boards.from_offline_database()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
@@ -21,3 +21,26 @@ class TestDatabaseMode(TestCase):
 
     def test_returns_default_database_mode_if_not_set_in_env(self):
         self.assertEqual(env.MBED_DATABASE_MODE, "AUTO")
+
+
+class TestCacheDir(TestCase):
+    @mock.patch.dict(os.environ, {"MBED_TARGETS_CACHE_DIR": "some/dir"})
+    def test_returns_cache_dir_set_in_env(self):
+        self.assertEqual(env.MBED_TARGETS_CACHE_DIR, "some/dir")
+
+    @mock.patch.dict(os.environ, {"XDG_CACHE_HOME": "xdg/cache"})
+    @mock.patch("mbed_targets.env.sys.platform", "linux")
+    def test_defaults_to_user_cache_dir(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop("MBED_TARGETS_CACHE_DIR", None)
+            self.assertEqual(env.MBED_TARGETS_CACHE_DIR, os.path.join("xdg", "cache", "mbed-targets"))
+
+
+class TestApiCacheTtl(TestCase):
+    @mock.patch.dict(os.environ, {"MBED_API_CACHE_TTL": "60"})
+    def test_returns_ttl_set_in_env(self):
+        self.assertEqual(env.MBED_API_CACHE_TTL, 60)
+
+    @mock.patch.dict(os.environ, {"MBED_API_CACHE_TTL": "soon"})
+    def test_returns_default_ttl_if_invalid(self):
+        self.assertEqual(env.MBED_API_CACHE_TTL, 0)
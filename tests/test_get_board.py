@@ -60,40 +60,61 @@ class TestGetBoard(TestCase):
         mocked_boards.from_online_database().get_board.assert_called_once_with(fn)
 
 
+@mock.patch("mbed_targets.get_board.board_database", autospec=True)
+@mock.patch("mbed_targets.get_board.Boards", autospec=True)
+@mock.patch("mbed_targets.get_board.env", spec_set=env)
 class TestGetBoardByProductCode(TestCase):
-    @mock.patch("mbed_targets.get_board.get_board")
-    def test_matches_boards_by_product_code(self, mock_get_board):
+    def test_looks_up_boards_in_compiled_snapshot(self, env, mocked_boards, board_database):
+        env.MBED_DATABASE_MODE = "OFFLINE"
+        board_database.get_compiled_offline_snapshot().find_by_product_code.return_value = {"product_code": "swag"}
+
+        subject = get_board_by_product_code("swag")
+
+        expected_board = make_board(board_type="", board_name="", slug="", target_type="", product_code="swag")
+        self.assertEqual(subject, expected_board)
+        board_database.get_compiled_offline_snapshot().find_by_product_code.assert_called_once_with("swag")
+        mocked_boards.from_offline_database.assert_not_called()
+
+    def test_raises_when_not_in_compiled_snapshot(self, env, mocked_boards, board_database):
+        env.MBED_DATABASE_MODE = "OFFLINE"
+        board_database.get_compiled_offline_snapshot().find_by_product_code.return_value = None
+
+        with self.assertRaises(UnknownBoard):
+            get_board_by_product_code("swag")
+
+    def test_looks_up_boards_by_product_code_without_compiled_snapshot(self, env, mocked_boards, board_database):
+        env.MBED_DATABASE_MODE = "OFFLINE"
+        board_database.get_compiled_offline_snapshot.return_value = None
         product_code = "swag"
 
-        self.assertEqual(get_board_by_product_code(product_code), mock_get_board.return_value)
+        subject = get_board_by_product_code(product_code)
+
+        self.assertEqual(subject, mocked_boards.from_offline_database().get_by_product_code.return_value)
+        mocked_boards.from_offline_database().get_by_product_code.assert_called_once_with(product_code)
 
-        # Test callable matches correct boards
-        fn = mock_get_board.call_args[0][0]
+    def test_auto_mode_falls_back_to_online_database_when_board_not_found(self, env, mocked_boards, board_database):
+        env.MBED_DATABASE_MODE = "AUTO"
+        board_database.get_compiled_offline_snapshot().find_by_product_code.return_value = None
 
-        matching_board = make_board(product_code=product_code)
-        not_matching_board = make_board(product_code="whatever")
+        subject = get_board_by_product_code("swag")
 
-        self.assertTrue(fn(matching_board))
-        self.assertFalse(fn(not_matching_board))
+        self.assertEqual(subject, mocked_boards.from_online_database().get_by_product_code.return_value)
+        mocked_boards.from_online_database().get_by_product_code.assert_called_once_with("swag")
 
 
+@mock.patch("mbed_targets.get_board.Boards", autospec=True)
+@mock.patch("mbed_targets.get_board.env", spec_set=env)
 class TestGetBoardByOnlineId(TestCase):
-    @mock.patch("mbed_targets.get_board.get_board")
-    def test_matches_boards_by_online_id(self, mock_get_board):
+    def test_looks_up_boards_by_online_id(self, env, mocked_boards):
+        env.MBED_DATABASE_MODE = "ONLINE"
         target_type = "platform"
 
-        self.assertEqual(get_board_by_online_id(slug="slug", target_type=target_type), mock_get_board.return_value)
-
-        # Test callable matches correct boards
-        fn = mock_get_board.call_args[0][0]
-
-        matching_board_1 = make_board(target_type=target_type, slug="slug")
-        matching_board_2 = make_board(target_type=target_type, slug="SlUg")
-        not_matching_board = make_board(target_type=target_type, slug="whatever")
+        subject = get_board_by_online_id(slug="slug", target_type=target_type)
 
-        self.assertTrue(fn(matching_board_1))
-        self.assertTrue(fn(matching_board_2))
-        self.assertFalse(fn(not_matching_board))
+        self.assertEqual(subject, mocked_boards.from_online_database().get_by_online_id.return_value)
+        mocked_boards.from_online_database().get_by_online_id.assert_called_once_with(
+            slug="slug", target_type=target_type
+        )
 
 
 @mock.patch("mbed_targets.get_board.env", spec_set=env)
@@ -10,5 +10,5 @@ from mbed_targets.mbed_tools import env_variables
 class TestEnvVariables(TestCase):
     def test_expected_env_variables_are_exposed(self):
         exposed = set(variable.name for variable in env_variables)
-        expected = {"MBED_DATABASE_MODE", "MBED_API_AUTH_TOKEN"}
+        expected = {"MBED_DATABASE_MODE", "MBED_API_AUTH_TOKEN", "MBED_TARGETS_CACHE_DIR", "MBED_API_CACHE_TTL"}
         self.assertEqual(exposed, expected)